@@ -108,9 +108,13 @@ class Player:
 
     # Rescales audio to avoid clipping after volume scaling.
     def rescale(self, block):
-        # First remove any DC component as this makes no sense for sound
-        block = numpy.float32(block)
-        block -= block.mean(axis = 0)
+        # First remove any DC component as this makes no sense for sound.  The
+        # sum is exact in 64-bit integers, and the mean is subtracted from the
+        # raw samples before conversion so only the centred signal is rounded
+        # to single precision.
+        mean = numpy.add.reduce(block, axis = 0, dtype = numpy.int64) * \
+            (1.0 / len(block))
+        block = numpy.float32(block - mean)
 
         # Compute the available dynamic range
         range = numpy.amax(numpy.abs(block))
@@ -76,7 +76,6 @@ class connection:
         self.sock = cosocket.socket()
         self.sock.connect((server, port))
         self.sock.settimeout(timeout)
-        self.buf = []
 
     def close(self):
         self.sock.close()
@@ -97,25 +96,25 @@ class connection:
                 break
         return ''.join(result)
 
-    def read_block(self, length):
-        result = numpy.empty(length, dtype = numpy.int8)
+    def read_array(self, dtype, shape):
+        '''Reads enough data to fill an array of the given dtype and shape and
+        returns it as an array of that type without any further copying.'''
+        dtype = numpy.dtype(dtype)
+        length = dtype.itemsize * int(numpy.prod(shape))
+        result = bytearray(length)
+        view = memoryview(result)
         rx = 0
-        buf = self.buf
-        while True:
-            l = len(buf)
-            if l:
-                if rx + l <= length:
-                    result.data[rx:rx+l] = buf
-                    buf = []
-                else:
-                    result.data[rx:] = buf[:length - rx]
-                    buf = buf[length - rx:]
-                rx += l
-                if rx >= length:
-                    break
-            buf = self.recv()
-        self.buf = buf
-        return result
+        while rx < length:
+            # Receive straight into the result.  We never ask for more than is
+            # needed, so there is no partial chunk left over for the next read.
+            l = self.sock.recv_into(view[rx:])
+            if not l:
+                raise self.EOF('Connection closed by server')
+            rx += l
+        return numpy.frombuffer(result, dtype = dtype).reshape(shape)
+
+    def read_block(self, length):
+        return self.read_array(numpy.int8, length)
 
 
 class subscription(connection):
@@ -132,10 +131,10 @@ class subscription(connection):
         self.count, format = format_mask(mask)
         self.decimated = decimated
 
-        flags = ''
-        if uncork: flags = flags + 'U'
-        if decimated: flags = flags + 'D'
-        self.sock.send('S%s%s\n' % (format, flags))
+        flags = b''
+        if uncork: flags = flags + b'U'
+        if decimated: flags = flags + b'D'
+        self.sock.sendall(b'S' + format.encode('ascii') + flags + b'\n')
         c = self.recv(1)
         if c != chr(0):
             raise self.Error((c + self.recv())[:-1])    # Discard trailing \n
@@ -146,31 +145,29 @@ class subscription(connection):
             wf = s.read(N)
         wf[n, b, x] = sample n of BPM b on channel x, where x=0 for horizontal
         position and x=1 for vertical position.'''
-        raw = self.read_block(8 * samples * self.count)
-        array = numpy.frombuffer(raw, dtype = numpy.int32)
-        return array.reshape((samples, self.count, 2))
+        return self.read_array(numpy.int32, (samples, self.count, 2))
 
 
 def server_command(command, **kargs):
     server = connection(**kargs)
-    server.sock.send(command)
+    server.sock.sendall(command)
     result = server.recv_all()
     server.close()
     return result
 
 
 def get_sample_frequency(**kargs):
-    return float(server_command('CF\n', **kargs))
+    return float(server_command(b'CF\n', **kargs))
 
 def get_decimation(**kargs):
-    return int(server_command('CC\n', **kargs))
+    return int(server_command(b'CC\n', **kargs))
 
 def get_fa_ids(**kargs):
     '''Connects to server to retrieve FA id list, returns a list of 3-tuples
     containing the following fields:
         (fa_id, description, archived)
     '''
-    raw_list = server_command('CL\n', **kargs)
+    raw_list = server_command(b'CL\n', **kargs)
     result = []
     line_match = re.compile('^( |\*)([0-9]+) (.*) (.*) (.*)$')
     for line in raw_list.split('\n')[:-1]:
@@ -194,7 +191,7 @@ class Server:
         self.port = port
         self.fa_ids = None
 
-        response = self.server_command('CFCK\n').split('\n')
+        response = self.server_command(b'CFCK\n').split('\n')
         self.sample_frequency = float(response[0])
         self.decimation = int(response[1])
         try:
@@ -40,7 +40,9 @@ class buffer:
     # Super lazy implementation: we always just copy the data to the bottom!
 
     def __init__(self, buffer_size):
-        self.buffer = numpy.zeros((buffer_size, 2))
+        # Store the raw int32 positions as received: this is exact and halves
+        # the size of the buffer we shuffle down on every write.
+        self.buffer = numpy.zeros((buffer_size, 2), dtype = numpy.int32)
         self.buffer_size = buffer_size
 
     def write(self, block):
@@ -65,6 +65,7 @@ class mode_common:
         self.show_x = True
         self.show_y = True
         self.__tray.setVisible(False)
+        self.window = numpy.zeros(0)
 
     def set_enable(self, enabled):
         self.__tray.setVisible(enabled)
@@ -84,6 +85,18 @@ class mode_common:
     def compute(self, value):
         return value
 
+    def get_window(self, N, windowed=True):
+        '''Returns a window of length N for scaled_abs_fft, or None if windowing
+        is not wanted.  The window is only recomputed when N changes.'''
+        if not windowed:
+            return None
+        if len(self.window) != N:
+            # The Hann window is good enough.  In some cases the Hamming window
+            # looks a bit better, but then I'd need a choice of windows.  Not
+            # really the point here, so just go for the simplest...
+            self.window = 1 + numpy.cos(numpy.linspace(-numpy.pi, numpy.pi, N))
+        return self.window
+
     def get_minmax(self, value):
         value = self.compute(value)
         ix = (self.show_x, self.show_y)
@@ -249,16 +262,11 @@ class mode_raw(mode_common):
         self.set_visible()
 
 
-def scaled_abs_fft(value, sample_frequency, windowed=False, axis=0):
+def scaled_abs_fft(value, sample_frequency, window=None, axis=0):
     '''Returns the fft of value (along axis 0) scaled so that values are in
     units per sqrt(Hz).  The magnitude of the first half of the spectrum is
-    returned.'''
-    if windowed:
-        # The Hann window is good enough.  In some cases the Hamming window
-        # looks a bit better, but then I'd need a choice of windows.  Not really
-        # the point here, so just go for the simplest...
-        window = 1 + numpy.cos(
-            numpy.linspace(-numpy.pi, numpy.pi, value.shape[axis]))
+    returned.  If a window is given it is applied along axis before the fft.'''
+    if window is not None:
         value = value * window[:, None]
     fft = numpy.fft.fft(value, axis=axis)
 
@@ -342,7 +350,8 @@ class mode_fft(mode_common):
         windowed = self.windowed.isChecked()
         if self.decimation == 1:
             result = scaled_abs_fft(
-                value, self.sample_frequency, windowed = windowed)
+                value, self.sample_frequency,
+                window = self.get_window(len(value), windowed))
         else:
             # Compute a decimated fft by segmenting the waveform (by reshaping),
             # computing the fft of each segment, and computing the mean power of
@@ -352,7 +361,8 @@ class mode_fft(mode_common):
             value = value[:points * self.decimation].reshape(
                 (self.decimation, points, 2))
             fft = scaled_abs_fft(
-                value, self.sample_frequency, windowed = windowed, axis=1)
+                value, self.sample_frequency,
+                window = self.get_window(points, windowed), axis=1)
             result = numpy.sqrt(numpy.mean(fft**2, axis=0))
         if self.show_squared:
             return result ** 2
@@ -409,7 +419,8 @@ class mode_fft_logf(mode_common):
     def compute(self, value):
         windowed = self.windowed.isChecked()
         fft = scaled_abs_fft(
-            value, self.sample_frequency, windowed = windowed)[1:]
+            value, self.sample_frequency,
+            window = self.get_window(len(value), windowed))[1:]
         fft_logf = numpy.sqrt(
             condense(fft**2, self.counts) / self.counts[:,None])
         if self.scalef: